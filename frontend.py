@@ -1,11 +1,21 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import threading
 import time
+import sqlite3
+import websocket
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Page configuration
 st.set_page_config(
@@ -41,72 +51,317 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+SYMBOLS = ("BTCUSDT", "ETHUSDT", "ADAUSDT", "DOTUSDT", "LINKUSDT")
+INTERVALS = ("1m", "5m", "15m", "1h", "4h", "1d")
+
+def parse_json(response):
+    """Decode a JSON response, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+# Largest page Binance returns from /klines
+KLINES_MAX_LIMIT = 1000
+
+class KlineCache:
+    """Local SQLite store for klines, keyed by (symbol, interval, open_time)"""
+    
+    def __init__(self, path="klines_cache.db", max_rows=KLINES_MAX_LIMIT):
+        # Each symbol/interval keeps at most one page of bars, the most any request needs
+        self.max_rows = max_rows
+        # Shared by the fetch worker threads, so guard the connection with a lock
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS klines (
+                symbol TEXT NOT NULL,
+                interval TEXT NOT NULL,
+                open_time INTEGER NOT NULL,
+                open REAL,
+                high REAL,
+                low REAL,
+                close REAL,
+                volume REAL,
+                PRIMARY KEY (symbol, interval, open_time)
+            )
+        """)
+        self.conn.commit()
+    
+    def stats(self, symbol, interval):
+        """Return (row count, latest open_time) cached for a symbol/interval"""
+        with self.lock:
+            return self.conn.execute(
+                "SELECT count(*), max(open_time) FROM klines WHERE symbol = ? AND interval = ?",
+                (symbol, interval)
+            ).fetchone()
+    
+    def insert(self, symbol, interval, rows):
+        """Write raw Binance kline rows; callers hold the lock and commit"""
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO klines (symbol, interval, open_time, open, high, low, close, volume) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(symbol, interval, r[0], float(r[1]), float(r[2]), float(r[3]),
+              float(r[4]), float(r[5])) for r in rows]
+        )
+    
+    def upsert(self, symbol, interval, rows):
+        """Store raw Binance kline rows, replacing bars that are already cached"""
+        with self.lock:
+            self.insert(symbol, interval, rows)
+            self.trim(symbol, interval)
+            self.conn.commit()
+    
+    def trim(self, symbol, interval):
+        """Delete all but the newest max_rows bars; callers hold the lock and commit"""
+        self.conn.execute(
+            "DELETE FROM klines WHERE symbol = ? AND interval = ? AND open_time < ("
+            "SELECT open_time FROM klines WHERE symbol = ? AND interval = ? "
+            "ORDER BY open_time DESC LIMIT 1 OFFSET ?)",
+            (symbol, interval, symbol, interval, self.max_rows - 1)
+        )
+    
+    def replace(self, symbol, interval, rows):
+        """Drop everything cached for a symbol/interval and store a fresh window,
+        so the cache always holds one contiguous run of bars"""
+        with self.lock:
+            self.conn.execute(
+                "DELETE FROM klines WHERE symbol = ? AND interval = ?",
+                (symbol, interval)
+            )
+            self.insert(symbol, interval, rows)
+            self.conn.commit()
+    
+    def tail(self, symbol, interval, limit):
+        """Return the latest cached rows, oldest first, in Binance's column order"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT open_time, open, high, low, close, volume FROM klines "
+                "WHERE symbol = ? AND interval = ? ORDER BY open_time DESC LIMIT ?",
+                (symbol, interval, limit)
+            ).fetchall()
+        rows.reverse()
+        return rows
+
 class BinanceAPI:
     def __init__(self):
         self.base_url = "https://api.binance.com/api/v3"
+        # Persistent session so repeated calls reuse pooled keep-alive connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self.session.mount("https://", adapter)
+        # Klines JSON compresses well; urllib3 decodes br when brotli is installed
+        self.session.headers.update({"Accept-Encoding": "gzip, br"})
+        self.kline_cache = KlineCache()
     
-    def get_historical_klines(self, symbol="BTCUSDT", interval="1m", limit=500):
-        """Fetch historical candlestick data from Binance"""
+    def request_klines(self, symbol, interval, limit, start_time=None):
+        """Fetch raw kline rows from Binance"""
         url = f"{self.base_url}/klines"
         params = {
             "symbol": symbol,
             "interval": interval,
             "limit": limit
         }
+        if start_time is not None:
+            params["startTime"] = start_time
         
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Convert to DataFrame
-            df = pd.DataFrame(data, columns=[
-                "open_time", "open", "high", "low", "close", "volume",
-                "close_time", "quote_asset_volume", "trades",
-                "taker_buy_base", "taker_buy_quote", "ignore"
-            ])
-            
-            # Convert timestamps and numeric columns
-            df["open_time"] = pd.to_datetime(df["open_time"], unit="ms")
-            df["close_time"] = pd.to_datetime(df["close_time"], unit="ms")
-            
-            numeric_cols = ["open", "high", "low", "close", "volume"]
-            df[numeric_cols] = df[numeric_cols].astype(float)
-            
-            return df
-            
-        except Exception as e:
-            st.error(f"Error fetching data: {e}")
-            return pd.DataFrame()
+        response = self.session.get(url, params=params, timeout=5)
+        response.raise_for_status()
+        return parse_json(response)
     
-    def get_current_price(self, symbol="BTCUSDT"):
-        """Get current price for a symbol"""
-        url = f"{self.base_url}/ticker/price"
-        params = {"symbol": symbol}
+    def get_historical_klines(self, symbol="BTCUSDT", interval="1m", limit=500):
+        """Fetch historical candlestick data, downloading only bars missing from the local cache"""
+        count, last_open_time = self.kline_cache.stats(symbol, interval)
+        
+        rows = None
+        if count >= limit:
+            # Refetch from the last cached bar, which may still have been open
+            rows = self.request_klines(symbol, interval, KLINES_MAX_LIMIT, start_time=last_open_time)
+            if len(rows) == KLINES_MAX_LIMIT:
+                # Cache is too far behind to catch up in one page
+                rows = None
+            else:
+                self.kline_cache.upsert(symbol, interval, rows)
+        
+        if rows is None:
+            # Replace rather than merge so no gap is left before the new window
+            rows = self.request_klines(symbol, interval, limit)
+            self.kline_cache.replace(symbol, interval, rows)
         
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            st.error(f"Error fetching current price: {e}")
-            return None
+        data = self.kline_cache.tail(symbol, interval, limit)
+        
+        # Build typed columns directly instead of casting an object-dtype frame;
+        # only the OHLCV columns are used downstream. Bars are at least a minute
+        # apart, so second resolution is enough. Values stay float64: they are
+        # shown to the cent in metrics and tables, which float32 cannot hold at
+        # five- and six-digit prices or large volumes.
+        n = len(data)
+        open_time = (np.fromiter((row[0] for row in data), dtype=np.int64, count=n) // 1000).view("datetime64[s]")
+        
+        numeric_cols = {"open": 1, "high": 2, "low": 3, "close": 4, "volume": 5}
+        numeric = {
+            col: np.fromiter((float(row[i]) for row in data), dtype=np.float64, count=n)
+            for col, i in numeric_cols.items()
+        }
+        
+        df = pd.DataFrame({"open_time": open_time, **numeric})
+        
+        return df
     
     def get_24hr_ticker(self, symbol="BTCUSDT"):
-        """Get 24hr ticker statistics"""
+        """Get 24hr ticker statistics, including the current price as lastPrice"""
         url = f"{self.base_url}/ticker/24hr"
         params = {"symbol": symbol}
         
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            st.error(f"Error fetching 24hr stats: {e}")
-            return None
+        response = self.session.get(url, params=params, timeout=5)
+        response.raise_for_status()
+        return parse_json(response)
+    
+    def get_24hr_tickers(self, symbols):
+        """Get 24hr ticker statistics for several symbols in one request, keyed by symbol"""
+        url = f"{self.base_url}/ticker/24hr"
+        params = {"symbols": json.dumps(list(symbols), separators=(",", ":"))}
+        
+        response = self.session.get(url, params=params, timeout=5)
+        response.raise_for_status()
+        return {ticker['symbol']: ticker for ticker in parse_json(response)}
+
+# Fields of the @ticker stream event mapped to their /ticker/24hr names
+TICKER_STREAM_FIELDS = {
+    "c": "lastPrice",
+    "p": "priceChange",
+    "P": "priceChangePercent",
+    "h": "highPrice",
+    "l": "lowPrice",
+    "v": "volume"
+}
+
+# Binance pushes @ticker events every second; older than this means the stream is down
+LIVE_TICKER_MAX_AGE = 5
+
+class LiveTicker:
+    """Background Binance WebSocket subscription holding the latest 24hr ticker for a symbol"""
+    
+    def __init__(self, symbol):
+        self.url = f"wss://stream.binance.com:9443/ws/{symbol.lower()}@ticker"
+        self.lock = threading.Lock()
+        self.ticker = None
+        self.received_at = 0.0
+        self.ws = websocket.WebSocketApp(self.url, on_message=self.on_message)
+        # The thread never touches Streamlit, so it needs no script context
+        self.thread = threading.Thread(target=self.ws.run_forever, kwargs={"reconnect": 5}, daemon=True)
+        self.thread.start()
+    
+    def on_message(self, ws, message):
+        data = orjson.loads(message) if orjson is not None else json.loads(message)
+        if not isinstance(data, dict) or data.get("e") != "24hrTicker":
+            return
+        ticker = {name: data[field] for field, name in TICKER_STREAM_FIELDS.items()}
+        with self.lock:
+            self.ticker = ticker
+            self.received_at = time.monotonic()
+    
+    def latest(self, max_age=LIVE_TICKER_MAX_AGE):
+        """Return the last received ticker in /ticker/24hr format, or None if it is
+        missing or older than max_age seconds"""
+        with self.lock:
+            if time.monotonic() - self.received_at > max_age:
+                return None
+            return self.ticker
+
+@st.cache_resource
+def get_live_ticker(symbol):
+    """Return the WebSocket ticker stream for a symbol, shared across sessions"""
+    return LiveTicker(symbol)
+
+@st.cache_resource
+def get_api():
+    """Return a BinanceAPI instance shared across script reruns"""
+    return BinanceAPI()
+
+# The cached fetchers let errors propagate: st.cache_data does not store
+# exceptions, so the next rerun retries instead of replaying a failure.
+# They run on worker threads with no script context, so they must not touch
+# the page; the caller's st.spinner covers the wait.
+@st.cache_data(ttl=2, show_spinner=False)
+def fetch_ticker_24h(symbol):
+    """Cached 24hr ticker lookup"""
+    return get_api().get_24hr_ticker(symbol)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_klines(symbol, interval, limit):
+    """Cached klines lookup (smallest interval is 1m, so at most 60s stale)"""
+    return get_api().get_historical_klines(symbol, interval, limit)
+
+def result_or_error(future, default, what):
+    """Return a fetch result, reporting a failure on the page and falling back to default"""
+    try:
+        return future.result()
+    except Exception as e:
+        st.error(f"Error fetching {what}: {e}")
+        return default
+
+def fetch_market_data(symbol, interval, limit):
+    """Fetch 24hr stats and klines in parallel"""
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f_kl = ex.submit(fetch_klines, symbol, interval, limit)
+        
+        # While the stream is delivering fresh tickers only the klines need REST
+        ticker_24hr = get_live_ticker(symbol).latest()
+        if ticker_24hr is None:
+            ticker_24hr = result_or_error(ex.submit(fetch_ticker_24h, symbol), None, "24hr stats")
+        
+        return ticker_24hr, result_or_error(f_kl, pd.DataFrame(), "data")
+
+MAX_CANDLES = 500
+
+def format_bar_width(width):
+    """Render a candle width in Binance interval notation, e.g. 2h"""
+    minutes = int(width.total_seconds() // 60)
+    if minutes % 1440 == 0:
+        return f"{minutes // 1440}d"
+    if minutes % 60 == 0:
+        return f"{minutes // 60}h"
+    return f"{minutes}m"
+
+def downsample_ohlcv(df, max_points=MAX_CANDLES):
+    """Merge adjacent candles so at most max_points bars are drawn.
+    
+    Returns the frame and the merged candle width, or None if nothing was merged.
+    """
+    if len(df) <= max_points:
+        return df, None
+    
+    # Median spacing ignores gaps left by exchange outages
+    bar = df['open_time'].diff().median()
+    factor = -(-len(df) // max_points)
+    width = bar * factor
+    resampled = df.set_index('open_time').resample(width).agg({
+        'open': 'first',
+        'high': 'max',
+        'low': 'min',
+        'close': 'last',
+        'volume': 'sum'
+    })
+    return resampled.dropna(subset=['open']).reset_index(), width
+
+# Figures cached per chart; each new bar or tick adds an entry, so keep only the latest
+MAX_CACHED_FIGURES = 16
+
+def candle_key(df):
+    """Cheap cache key for a klines frame: first and last bar time, row count and last close"""
+    return (df['open_time'].iat[0].value, df['open_time'].iat[-1].value, len(df), df['close'].iat[-1])
+
+def volume_key(df):
+    """Cheap cache key for the volume chart: first and last bar time, row count and last volume"""
+    return (df['open_time'].iat[0].value, df['open_time'].iat[-1].value, len(df), df['volume'].iat[-1])
 
+@st.cache_data(hash_funcs={pd.DataFrame: candle_key}, max_entries=MAX_CACHED_FIGURES)
 def create_candlestick_chart(df, title="BTC/USDT Price Chart"):
     """Create an interactive candlestick chart"""
+    df, width = downsample_ohlcv(df)
+    if width is not None:
+        title = f"{title} - resampled to {format_bar_width(width)} candles"
     fig = go.Figure(data=[
         go.Candlestick(
             x=df['open_time'],
@@ -129,13 +384,19 @@ def create_candlestick_chart(df, title="BTC/USDT Price Chart"):
     
     return fig
 
-def create_volume_chart(df):
+@st.cache_data(hash_funcs={pd.DataFrame: volume_key}, max_entries=MAX_CACHED_FIGURES)
+def create_volume_chart(df, title="Trading Volume"):
     """Create volume chart"""
-    fig = px.bar(df, x='open_time', y='volume', 
-                 title="Trading Volume",
-                 labels={'volume': 'Volume', 'open_time': 'Time'})
+    fig = go.Figure(go.Bar(
+        x=df['open_time'],
+        y=df['volume'],
+        marker_line_width=0
+    ))
     
     fig.update_layout(
+        title=title,
+        xaxis_title="Time",
+        yaxis_title="Volume",
         template="plotly_dark",
         height=300,
         showlegend=False
@@ -143,80 +404,74 @@ def create_volume_chart(df):
     
     return fig
 
-def main():
-    # Initialize Binance API
-    binance = BinanceAPI()
-    
-    # Header
-    st.markdown('<h1 class="main-header">📈 Binance Crypto Dashboard</h1>', unsafe_allow_html=True)
-    
-    # Sidebar
-    st.sidebar.title("Configuration")
-    
-    # Symbol selection
-    symbols = ["BTCUSDT", "ETHUSDT", "ADAUSDT", "DOTUSDT", "LINKUSDT"]
-    selected_symbol = st.sidebar.selectbox("Select Symbol", symbols, index=0)
-    
-    # Time interval selection
-    intervals = ["1m", "5m", "15m", "1h", "4h", "1d"]
-    selected_interval = st.sidebar.selectbox("Select Interval", intervals, index=3)
-    
-    # Data limit
-    data_limit = st.sidebar.slider("Number of Data Points", min_value=100, max_value=1000, value=500, step=100)
-    
-    # Auto-refresh
-    auto_refresh = st.sidebar.checkbox("Auto-refresh (10 seconds)", value=False)
-    
+# Price Statistics rows as (label, key into the formatted metrics dict)
+STATS_ROWS = (
+    ('Current Price', 'current_price'),
+    ('24h Change', 'price_change'),
+    ('24h Change %', 'price_change_percent'),
+    ('24h High', 'high_24h'),
+    ('24h Low', 'low_24h'),
+    ('24h Volume', 'volume')
+)
+
+def build_stats_df(metrics):
+    """Lay out the formatted ticker metrics as the Price Statistics table"""
+    return pd.DataFrame({
+        'Metric': [label for label, _ in STATS_ROWS],
+        'Value': [metrics[key] if metrics else "N/A" for _, key in STATS_ROWS]
+    })
+
+def dashboard(selected_symbol, selected_interval, data_limit):
+    """Fetch market data and render the metrics and chart tabs"""
     # Main content
     col1, col2, col3, col4 = st.columns(4)
     
-    # Fetch current price and 24hr stats
-    current_price_data = binance.get_current_price(selected_symbol)
-    ticker_24hr = binance.get_24hr_ticker(selected_symbol)
-    
-    if current_price_data and ticker_24hr:
-        current_price = float(current_price_data['price'])
-        price_change = float(ticker_24hr['priceChange'])
-        price_change_percent = float(ticker_24hr['priceChangePercent'])
-        volume = float(ticker_24hr['volume'])
-        high_24h = float(ticker_24hr['highPrice'])
-        low_24h = float(ticker_24hr['lowPrice'])
+    # Fetch 24hr stats (which include the current price) and historical data concurrently
+    with st.spinner("Fetching market data..."):
+        ticker_24hr, df = fetch_market_data(
+            selected_symbol, selected_interval, data_limit
+        )
+    
+    # Format the ticker once for both the metric cards and the statistics table
+    metrics = None
+    if ticker_24hr:
+        metrics = {
+            'current_price': f"${float(ticker_24hr['lastPrice']):,.2f}",
+            'price_change': f"${float(ticker_24hr['priceChange']):,.2f}",
+            'price_change_percent': f"{float(ticker_24hr['priceChangePercent']):.2f}%",
+            'high_24h': f"${float(ticker_24hr['highPrice']):,.2f}",
+            'low_24h': f"${float(ticker_24hr['lowPrice']):,.2f}",
+            'volume': f"${float(ticker_24hr['volume']):,.0f}"
+        }
         
         with col1:
             st.metric(
                 label=f"Current Price ({selected_symbol})",
-                value=f"${current_price:,.2f}",
-                delta=f"{price_change_percent:.2f}%"
+                value=metrics['current_price'],
+                delta=metrics['price_change_percent']
             )
         
         with col2:
             st.metric(
                 label="24h Volume",
-                value=f"${volume:,.0f}"
+                value=metrics['volume']
             )
         
         with col3:
             st.metric(
                 label="24h High",
-                value=f"${high_24h:,.2f}"
+                value=metrics['high_24h']
             )
         
         with col4:
             st.metric(
                 label="24h Low",
-                value=f"${low_24h:,.2f}"
+                value=metrics['low_24h']
             )
     
     # Fetch and display historical data
     st.subheader(f"Price Chart - {selected_symbol}")
     
-    with st.spinner("Fetching market data..."):
-        df = binance.get_historical_klines(
-            symbol=selected_symbol,
-            interval=selected_interval,
-            limit=data_limit
-        )
-    
     if not df.empty:
         # Create tabs for different visualizations
         tab1, tab2, tab3, tab4 = st.tabs(["Candlestick Chart", "Price Analysis", "Volume Analysis", "Raw Data"])
@@ -230,67 +485,93 @@ def main():
             
             with col1:
                 # Price trend line
-                fig_line = px.line(df, x='open_time', y='close', 
-                                 title=f"{selected_symbol} Price Trend",
-                                 labels={'close': 'Price (USDT)', 'open_time': 'Time'})
-                fig_line.update_layout(template="plotly_dark", height=400)
+                fig_line = go.Figure(go.Scattergl(
+                    x=df['open_time'],
+                    y=df['close'],
+                    mode='lines'
+                ))
+                fig_line.update_layout(
+                    title=f"{selected_symbol} Price Trend",
+                    xaxis_title="Time",
+                    yaxis_title="Price (USDT)",
+                    template="plotly_dark",
+                    height=400
+                )
                 st.plotly_chart(fig_line, use_container_width=True)
             
             with col2:
                 # Price statistics
                 st.subheader("Price Statistics")
-                stats_data = {
-                    'Metric': ['Current Price', '24h Change', '24h Change %', '24h High', '24h Low', '24h Volume'],
-                    'Value': [
-                        f"${current_price:,.2f}" if current_price_data else "N/A",
-                        f"${price_change:,.2f}" if ticker_24hr else "N/A",
-                        f"{price_change_percent:.2f}%" if ticker_24hr else "N/A",
-                        f"${high_24h:,.2f}" if ticker_24hr else "N/A",
-                        f"${low_24h:,.2f}" if ticker_24hr else "N/A",
-                        f"${volume:,.0f}" if ticker_24hr else "N/A"
-                    ]
-                }
-                stats_df = pd.DataFrame(stats_data)
+                stats_df = build_stats_df(metrics)
                 st.dataframe(stats_df, use_container_width=True, hide_index=True)
         
         with tab3:
-            fig_volume = create_volume_chart(df)
+            fig_volume = create_volume_chart(df, f"{selected_symbol} Trading Volume ({selected_interval})")
             st.plotly_chart(fig_volume, use_container_width=True)
             
             # Volume statistics
+            volume_stats = df['volume'].agg(['mean', 'max'])
             col1, col2 = st.columns(2)
             with col1:
-                st.metric("Average Volume", f"${df['volume'].mean():.2f}")
+                st.metric("Average Volume", f"${volume_stats['mean']:.2f}")
             with col2:
-                st.metric("Max Volume", f"${df['volume'].max():.2f}")
+                st.metric("Max Volume", f"${volume_stats['max']:.2f}")
         
         with tab4:
             st.subheader("Raw Market Data")
-            st.dataframe(df.tail(20), use_container_width=True)
+            st.dataframe(df.iloc[-20:], use_container_width=True)
             
             # Data summary
             st.subheader("Data Summary")
             summary_col1, summary_col2, summary_col3 = st.columns(3)
+            summary = df.agg({
+                'open_time': ['min', 'max'],
+                'close': ['mean', 'std'],
+                'low': ['min'],
+                'high': ['max']
+            })
             
             with summary_col1:
                 st.metric("Total Records", len(df))
-                st.metric("Date Range", f"{df['open_time'].min().strftime('%Y-%m-%d')} to {df['open_time'].max().strftime('%Y-%m-%d')}")
+                st.metric("Date Range", f"{summary.loc['min', 'open_time'].strftime('%Y-%m-%d')} to {summary.loc['max', 'open_time'].strftime('%Y-%m-%d')}")
             
             with summary_col2:
-                st.metric("Average Price", f"${df['close'].mean():.2f}")
-                st.metric("Price Std Dev", f"${df['close'].std():.2f}")
+                st.metric("Average Price", f"${summary.loc['mean', 'close']:.2f}")
+                st.metric("Price Std Dev", f"${summary.loc['std', 'close']:.2f}")
             
             with summary_col3:
-                st.metric("Min Price", f"${df['low'].min():.2f}")
-                st.metric("Max Price", f"${df['high'].max():.2f}")
+                st.metric("Min Price", f"${summary.loc['min', 'low']:.2f}")
+                st.metric("Max Price", f"${summary.loc['max', 'high']:.2f}")
     
     else:
         st.error("No data available. Please check your connection or try a different symbol.")
+
+def main():
+    # Header
+    st.markdown('<h1 class="main-header">📈 Binance Crypto Dashboard</h1>', unsafe_allow_html=True)
+    
+    # Sidebar
+    st.sidebar.title("Configuration")
+    
+    # Symbol selection
+    selected_symbol = st.sidebar.selectbox("Select Symbol", SYMBOLS, index=0)
+    
+    # Time interval selection
+    selected_interval = st.sidebar.selectbox("Select Interval", INTERVALS, index=3)
+    
+    # Data limit
+    data_limit = st.sidebar.slider("Number of Data Points", min_value=100, max_value=1000, value=500, step=100)
+    
+    # Auto-refresh
+    auto_refresh = st.sidebar.checkbox("Auto-refresh (10 seconds)", value=False)
+    
+    # Drop cached API responses
+    if st.sidebar.button("Force refresh"):
+        st.cache_data.clear()
     
-    # Auto-refresh functionality
-    if auto_refresh:
-        time.sleep(10)
-        st.rerun()
+    # Metrics and charts rerun on their own timer without redrawing the sidebar
+    refresh_every = 10 if auto_refresh else None
+    st.fragment(run_every=refresh_every)(dashboard)(selected_symbol, selected_interval, data_limit)
     
     # Footer
     st.markdown("---")